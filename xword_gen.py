@@ -9,10 +9,12 @@ Algorithm:
     1. sort words by length, longest to shortest
     2. create an empty square grid of at least size of longest word
     3. place longest word first in pseudo-random position
-    4. choose next longest word and find a valid fit, or no fit; repeat until no more words
-    5. if not all words were placed, try again for 10 total times (empirically works sometimes)
+    4. choose next longest word and find a valid fit; repeat until no more words, abandoning the attempt on no fit
+    5. if not all words were placed, try again for 5 total times (empirically works sometimes)
     6. if still not all words were placed, repeat 2 - 5 with grid size + 1
-    7. maintain dict of valid candidate grids, return grid of highest density
+    7. keep the valid candidate grid of highest density seen so far, and return it
+    8. if no valid candidate grid was found, run a backtracking search from the minimum grid size upward, taking
+       the first size it fills, before giving up
 
 Notes: empirically, this algorithm generates a crossword in less than a second. It produces a large number 
 of candidate crosswords and selects the one with highest density, which we assume to be a more desirable 
@@ -22,27 +24,42 @@ Also note that this can easily be adapted to build a word search puzzle.
 
 import random
 import time
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+
+
+# grid cells hold ASCII byte values, with a space marking a blank cell
+BLANK = ord(' ')
 
 
 def init_grid(size: int):
     """
     Initializes and returns an empty grid of specified size.
+    The grid is a flat bytearray of size * size cells in row-major order, so cell (row, col) is grid[row * size + col].
+    Rows are contiguous slices grid[row * size:(row + 1) * size] and cols are strided slices grid[col::size].
     """
-    return [[' ' for _ in range(size)] for _ in range(size)]
+    return bytearray(b' ' * (size * size))
 
 
-def build_crossword(grid, wordlist_sorted):
+def build_crossword(grid, size, wordlist_sorted, words_by_first, max_len, rng=random, changes=None, strict=True):
     """
     Builds crossword on input grid of given size from a sorted list of words according to specified algorithm.
-    Returns crossword as grid and placements dictionary.
+    Takes the words grouped by first letter and the longest word length for adjacency checks, and the random
+    generator used to place the first word.
+    If a changes list is given, filled cells are pushed onto it (see place_word).
+    Returns crossword as grid and placements list. In strict mode, gives up and returns None as soon as a word can't
+    be placed, since generate discards partial crosswords anyway; otherwise skips that word and carries on.
     """
 
-    # track word placement {word number : [word, starting pos (row, col), direction 'H' or 'V']}
-    placements = {}
+    # track word placement [(word, starting row, starting col, direction 'H' or 'V')] by word number - 1
+    placements = [None] * len(wordlist_sorted)
+
+    # track grid positions of each letter {letter byte : set of (row, col)}
+    letter_positions = defaultdict(set)
 
     # place the first word at a random valid position
     first = wordlist_sorted[0]
-    grid, placements = place_first(grid, first, placements)
+    grid, placements = place_first(grid, size, first, placements, letter_positions, rng, changes)
 
     # loop over remaining words
     words = wordlist_sorted[1:]
@@ -50,337 +67,546 @@ def build_crossword(grid, wordlist_sorted):
         word = words[i]
 
         # find best placement on grid and place it there
-        row, col, letter_idx, direction = find_best_placement(word, grid, wordlist_sorted)
-        if row or col or letter_idx or direction:
-            grid, placements = place_word(grid, word, letter_idx, row, col, direction, placements, i + 2)
+        placement = find_best_placement(word, grid, size, words_by_first, max_len, letter_positions)
+        if placement is not None:
+            row, col, letter_idx, direction = placement
+            grid, placements = place_word(grid, size, word, letter_idx, row, col, direction, placements, i + 2,
+                                          letter_positions, changes)
+        elif strict:
+            return None
         
     # the grid is now built
     return grid, placements
 
 
-def place_first(grid, first: str, placements):
+def search_crossword(grid, size, wordlist_sorted, words_by_first, max_len, max_nodes=2000):
     """
-    Helper function to place the first word on grid pseudorandomly.
+    Builds crossword on input grid of given size by backtracking search over word placements.
+    Each word is a variable whose domain is its valid placements on the current grid. The word with the fewest
+    valid placements is placed next (MRV), trying its densest placements first, and placements are undone on dead
+    ends. Gives up after max_nodes placements have been tried.
+    Returns crossword as grid and placements list, or None if no crossword was found.
     """
 
-    # track the size of grid for ease
-    size = len(grid)
+    # track word placement [(word, starting row, starting col, direction 'H' or 'V')] by word number - 1
+    placements = [None] * len(wordlist_sorted)
+
+    # track grid positions of each letter {letter byte : set of (row, col)}
+    letter_positions = defaultdict(set)
+
+    # stack of grid cells written, so placements can be undone instead of copying the grid
+    changes = []
+
+    # indices into wordlist_sorted of words not yet placed
+    remaining = set(range(1, len(wordlist_sorted)))
+
+    # count placements tried against max_nodes
+    nodes = 0
+
+    def search():
+        nonlocal nodes
+
+        # every word is placed, so the crossword is built
+        if not remaining:
+            return True
+
+        # find the remaining word with fewest valid placements; words with none may still fit later
+        best_idx = None
+        best_count = None
+        for idx in remaining:
+            count = 0
+            for _ in iter_placements(wordlist_sorted[idx], grid, size, words_by_first, max_len, letter_positions):
+                count += 1
+                # stop counting once this word can't beat the current best
+                if best_count is not None and count >= best_count:
+                    break
+            if count and (best_count is None or count < best_count):
+                best_idx = idx
+                best_count = count
+
+        # dead end if no remaining word can be placed
+        if best_idx is None:
+            return False
+
+        # try densest placements first, undoing each one that leads to a dead end
+        best_candidates = sorted(iter_placements(wordlist_sorted[best_idx], grid, size, words_by_first, max_len,
+                                                 letter_positions), key=lambda candidate: candidate[0], reverse=True)
+        word = wordlist_sorted[best_idx]
+        remaining.discard(best_idx)
+        for num_overlaps, row, col, letter_idx, direction in best_candidates:
+            if nodes >= max_nodes:
+                break
+            nodes += 1
+            mark = len(changes)
+            place_word(grid, size, word, letter_idx, row, col, direction, placements, best_idx + 1,
+                       letter_positions, changes)
+            if search():
+                return True
+            unplace_word(grid, size, changes, mark, letter_positions)
+            placements[best_idx] = None
+        remaining.add(best_idx)
+        return False
+
+    # place the first word horizontally at every starting position; by symmetry this covers vertical starts too
+    first = wordlist_sorted[0]
+    for row in range(size):
+        for col in range(size - len(first) + 1):
+            if nodes >= max_nodes:
+                return None
+            place_word(grid, size, first, 0, row, col, 'H', placements, 1, letter_positions, changes)
+            if search():
+                return grid, placements
+            unplace_word(grid, size, changes, 0, letter_positions)
+            placements[0] = None
+
+    # search space or node budget is exhausted
+    return None
+
+
+def place_first(grid, size, first: bytes, placements, letter_positions, rng=random, changes=None):
+    """
+    Helper function to place the first word on grid pseudorandomly.
+    """
 
     # choose a direction and starting position at random and place word there
-    direction = random.choice(['V', 'H'])
+    direction = rng.choice(['V', 'H'])
     if direction == 'H':
-        row = random.randint(0, size - 1)
-        return place_word(grid, first, 0, row, 0, 'H', placements, 1)
+        row = rng.randint(0, size - 1)
+        return place_word(grid, size, first, 0, row, 0, 'H', placements, 1, letter_positions, changes)
     elif direction == 'V':
-        col = random.randint(0, size - 1)
-        return place_word(grid, first, 0, 0, col, 'V', placements, 1)
+        col = rng.randint(0, size - 1)
+        return place_word(grid, size, first, 0, 0, col, 'V', placements, 1, letter_positions, changes)
 
 
-def place_word(grid, word: str, letter_idx: int, row, col, direction, placements, wordnum):
+def place_word(grid, size, word: bytes, letter_idx: int, row, col, direction, placements, wordnum, letter_positions,
+               changes=None):
     """
     Helper function to place word on grid at specified row, col, adjusted for letter index, and in given direction.
-    Also updates placement dictionary with word number in list of original input words.
+    Also updates placements list at word number in list of sorted input words, and the letter position
+    index used by find_best_placement.
+    If a changes list is given, the grid index of each blank cell filled is pushed onto it for unplace_word.
     """
     if direction == 'H':
-        placements[wordnum] = [word, (row, col - letter_idx), 'H']
+        placements[wordnum - 1] = (word.decode('ascii'), row, col - letter_idx, 'H')
+        start = row * size + col - letter_idx
+        if changes is not None:
+            changes.extend(start + i for i in range(len(word)) if grid[start + i] == BLANK)
+        grid[start:start + len(word)] = word
         for i in range(len(word)):
-            grid[row][col - letter_idx + i] = word[i]
+            letter_positions[word[i]].add((row, col - letter_idx + i))
     elif direction == 'V':
-        placements[wordnum] = [word, (row - letter_idx, col), 'V']
+        placements[wordnum - 1] = (word.decode('ascii'), row - letter_idx, col, 'V')
+        start = (row - letter_idx) * size + col
+        if changes is not None:
+            changes.extend(start + i * size for i in range(len(word)) if grid[start + i * size] == BLANK)
+        grid[start:start + len(word) * size:size] = word
         for i in range(len(word)):
-            grid[row - letter_idx + i][col] = word[i]
+            letter_positions[word[i]].add((row - letter_idx + i, col))
                 
     return grid, placements
 
 
-def find_best_placement(word: str, grid, wordlist_sorted):
+def unplace_word(grid, size, changes, mark, letter_positions=None):
+    """
+    Helper function to undo word placements by blanking the cells pushed onto changes since it had length mark.
+    Also removes those cells from the letter position index, if given.
+    """
+    while len(changes) > mark:
+        idx = changes.pop()
+        if letter_positions is not None:
+            letter_positions[grid[idx]].discard(divmod(idx, size))
+        grid[idx] = BLANK
+
+
+def find_best_placement(word: bytes, grid, size, words_by_first, max_len, letter_positions):
     """
     Finds a best (dense) placement for a word on the grid.
-    Tracks a best score and position based on is_valid_placement return value for count of letter overlaps.
-    Placement with most valid letter overlaps will win.
+    Tracks a best score and position based on is_valid_placement_h/_v count of letter overlaps for each placement
+    from iter_placements. Placement with most valid letter overlaps will win, first seen on ties.
+    Stops early once a placement overlaps as many letters as the grid could supply, which is dense enough.
+    Returns (row, col, letter index, direction), or None if the word doesn't fit.
     """
 
     # track candidate positions
     best_score = -1 
     best_position = None
 
-    # loop over each letter in word
-    for i in range(len(word)):
-        letter = word[i]
+    # most overlaps possible: letters of the word matched by letters on the grid, short of the whole word
+    max_possible = 0
+    for letter in set(word):
+        max_possible += min(word.count(letter), len(letter_positions.get(letter, ())))
+    max_possible = min(max_possible, len(word) - 1)
+
+    # only save placement if denser than current
+    candidates = iter_placements(word, grid, size, words_by_first, max_len, letter_positions)
+    for num_overlaps, row, col, i, direction in candidates:
+        if num_overlaps > best_score:
+            best_score = num_overlaps
+            best_position = (row, col, i, direction)
+            if best_score >= max_possible:
+                break
 
-        # loop over each spot in grid
-        size = len(grid)
-        for row in range(size):
-            for col in range(size):
-                
-                # only proceed if letters overlap
-                if letter == grid[row][col]:
-
-                    # check placement validity, only save placement if denser than current                
-                    h_valid = is_valid_placement(grid, word, i, row, col, 'H', wordlist_sorted)
-                    if h_valid:
-                        if h_valid[1] >= best_score:
-                            best_score = h_valid[1]
-                            best_position = (row, col, i, 'H')
-                    v_valid = is_valid_placement(grid, word, i, row, col, 'V', wordlist_sorted)
-                    if v_valid:
-                        if v_valid[1] >= best_score:
-                            best_score = v_valid[1]
-                            best_position = (row, col, i, 'V')
-                  
-    # if never found a position, word unusable on current grid size; will build bigger grid in generate()
-    if not best_position:
-        return False, False, False, False
-    else:
-        # print(best_score)
-        return best_position
+    # if never found a position (None), word unusable on current grid size; will build bigger grid in generate()
+    return best_position
+
+
+def iter_placements(word: bytes, grid, size, words_by_first, max_len, letter_positions):
+    """
+    Generates every valid placement for a word on the grid as (num_overlaps, row, col, letter index, direction).
+    Only grid cells holding a letter of the word are visited, looked up in the letter position index, and only
+    letter indices that keep the word inside the grid bounds are checked.
+    Letters that are rarest on the grid are visited first, so ties in find_best_placement go to placements crossing
+    rare letters, keeping common letters free for later words.
+    """
+
+    # memo of adjacency checks, fresh per call since placing a word changes the grid
+    adj_cache = {}
+
+    # group letter indices of the word by letter {letter byte : sorted list of indices}
+    letter_indices = defaultdict(list)
+    for i in range(len(word)):
+        letter_indices[word[i]].append(i)
+
+    # loop over each distinct letter in word, rarest on the grid first
+    wlen = len(word)
+    for letter in sorted(letter_indices, key=lambda letter: len(letter_positions.get(letter, ()))):
+        indices = letter_indices[letter]
+
+        # loop over each spot in grid where letters overlap
+        for row, col in letter_positions.get(letter, ()):
+
+            # check placement validity for indices that fit horizontally
+            lo = bisect_left(indices, col + wlen - size)
+            hi = bisect_right(indices, col)
+            for i in indices[lo:hi]:
+                h_valid = is_valid_placement_h(grid, size, word, i, row, col, words_by_first, max_len, adj_cache)
+                if h_valid:
+                    yield h_valid[1], row, col, i, 'H'
+
+            # same for indices that fit vertically
+            lo = bisect_left(indices, row + wlen - size)
+            hi = bisect_right(indices, row)
+            for i in indices[lo:hi]:
+                v_valid = is_valid_placement_v(grid, size, word, i, row, col, words_by_first, max_len, adj_cache)
+                if v_valid:
+                    yield v_valid[1], row, col, i, 'V'
 
                    
-def is_valid_placement(grid, word: str, letter_idx: int, row, col, direction, wordlist_sorted):
+def is_valid_placement_h(grid, size, word: bytes, letter_idx: int, row, col, words_by_first, max_len, adj_cache):
     """
-    Helper function for find_best_placement to check if a potential placement is valid.
-    Investigates placement of word on grid at row, col, letter index and direction, returns True only if valid.
+    Helper function for find_best_placement to check if a potential horizontal placement is valid.
+    Investigates placement of word on grid at row, col and letter index, returns True only if valid.
     Also tracks number of overlaps for find_best_placement to maximize for dense crosswords.
+    Adjacency checks share adj_cache, see is_adjacent_word.
     """
 
-    # save grid size for ease of use
-    size = len(grid)
-
     # track number of overlaps
     num_overlaps = 0
 
-    # check horizontal case
-    if direction == 'H':
+    # save word length for ease of use
+    wlen = len(word)
 
-        # check left bound and right bound
-        if col - letter_idx < 0 or col - letter_idx + len(word) > size:
-            return False
+    # save starting col of word and its flat grid index, so the loop only adds offsets
+    start = col - letter_idx
+    base = row * size + start
 
-        # check upper border of word (must be blank or at edge)
-        if col - letter_idx > 0 and grid[row][col - letter_idx - 1] != ' ':
-            return False
-        
-        # check lower border of word (must be blank or at edge)
-        if col - letter_idx + len(word) < size and grid[row][col - letter_idx + len(word)] != ' ':
-            return False
+    # check left bound and right bound
+    if start < 0 or start + wlen > size:
+        return False
 
-        # loop over letters in word to check letter placement
-        for i in range(len(word)):
+    # check left border of word (must be blank or at edge)
+    if start > 0 and grid[base - 1] != BLANK:
+        return False
+    
+    # check right border of word (must be blank or at edge)
+    if start + wlen < size and grid[base + wlen] != BLANK:
+        return False
 
-            # check if there is a different letter at this spot already
-            if grid[row][col - letter_idx + i] not in (' ', word[i]):
-                return False
-            
-            # track number of overlaps
-            if grid[row][col - letter_idx + i] == word[i]:
-                num_overlaps += 1
-            
-            # check for adjacent words in the row above
-            if row > 0 and grid[row - 1][col - letter_idx + i] != ' ' and i != letter_idx:
-                if is_adjacent_word(grid, row - 1, col - letter_idx + i, 'V', wordlist_sorted):
-                    num_overlaps += 1
-                else:
-                    return False
-            
-            # check for adjacent words in the row below
-            if row < size - 1 and grid[row + 1][col - letter_idx + i] != ' ' and i != letter_idx:
-                if is_adjacent_word(grid, row + 1, col - letter_idx + i, 'V', wordlist_sorted):
-                    num_overlaps += 1
-                else:
-                    return False
-        
-     # check vertical case
-    elif direction == 'V':
+    # save whether there are rows above and below
+    has_up = row > 0
+    has_down = row < size - 1
 
-        # check upper bound and lower bound
-        if row - letter_idx < 0 or row - letter_idx + len(word) > size:
-            return False
-        
-         # check left border of word (must be blank or at edge)
-        if row - letter_idx > 0 and grid[row - letter_idx - 1][col] != ' ':
+    # loop over letters in word to check letter placement
+    for i in range(wlen):
+        cell = grid[base + i]
+        letter = word[i]
+
+        # check if there is a different letter at this spot already
+        if cell != BLANK and cell != letter:
             return False
         
-        # check right border of word (must be blank or at edge)
-        if row - letter_idx + len(word) < size and grid[row - letter_idx + len(word)][col] != ' ':
-            return False
-
-        # loop over letters in word to check letter placement
-        for i in range(len(word)):
+        # track number of overlaps
+        if cell == letter:
+            num_overlaps += 1
 
-            # check if there is a different letter at this spot already
-            if grid[row - letter_idx + i][col] not in (' ', word[i]):
-                return False
-            
-            # track number of overlaps
-            if grid[row - letter_idx + i][col] == word[i]:
+        # the crossing letter is part of an existing word, so only check neighbors of the others
+        if i == letter_idx:
+            continue
+        
+        # check for adjacent words in the row above
+        if has_up and grid[base + i - size] != BLANK:
+            if is_adjacent_word(grid, size, row - 1, start + i, 'V', words_by_first, max_len, adj_cache):
                 num_overlaps += 1
-            
-            # check for adjacent words in the col to left
-            if col > 0 and grid[row - letter_idx + i][col - 1] != ' ' and i != letter_idx:
-                if is_adjacent_word(grid, row - letter_idx + i, col - 1, 'H', wordlist_sorted):
-                    num_overlaps += 1
-                else:
-                    return False
-            
-            # check for adjacent words in the col to right
-            if col < size - 1 and grid[row - letter_idx + i][col + 1] != ' ' and i != letter_idx:
-                if is_adjacent_word(grid, row - letter_idx + i, col + 1, 'H', wordlist_sorted):
-                    num_overlaps += 1
-                else:
-                    return False
-                           
+            else:
+                return False
         
+        # check for adjacent words in the row below
+        if has_down and grid[base + i + size] != BLANK:
+            if is_adjacent_word(grid, size, row + 1, start + i, 'V', words_by_first, max_len, adj_cache):
+                num_overlaps += 1
+            else:
+                return False
+
     # if all these tests pass, it's valid
     return True, num_overlaps
 
 
-def is_adjacent_word(grid, row, col, direction, wordlist_sorted):
+def is_valid_placement_v(grid, size, word: bytes, letter_idx: int, row, col, words_by_first, max_len, adj_cache):
     """
-    Helper function for is_valid_placement, called when letter detected at given row, col.
-    Check if letters detected there extend to form a valid word from wordlist in given direction. 
+    Vertical counterpart of is_valid_placement_h.
     """
 
-    # save max searching length
-    max_len = len(max(wordlist_sorted, key=len))
+    # track number of overlaps
+    num_overlaps = 0
 
-    # check vertical case
-    if direction == 'V':
+    # save word length for ease of use
+    wlen = len(word)
+
+    # save starting row of word and its flat grid index, so the loop only adds offsets
+    start = row - letter_idx
+    base = start * size + col
+
+    # check upper bound and lower bound
+    if start < 0 or start + wlen > size:
+        return False
+    
+    # check upper border of word (must be blank or at edge)
+    if start > 0 and grid[base - size] != BLANK:
+        return False
+    
+    # check lower border of word (must be blank or at edge)
+    if start + wlen < size and grid[base + wlen * size] != BLANK:
+        return False
+
+    # save whether there are cols to left and right
+    has_left = col > 0
+    has_right = col < size - 1
+
+    # loop over letters in word to check letter placement
+    for i in range(wlen):
+        idx = base + i * size
+        cell = grid[idx]
+        letter = word[i]
 
-        # build up a candidate word starting at the detected letter
-        word = grid[row][col]
+        # check if there is a different letter at this spot already
+        if cell != BLANK and cell != letter:
+            return False
+        
+        # track number of overlaps
+        if cell == letter:
+            num_overlaps += 1
 
-        # look up
-        for i in range(1, max_len):            
-            # check boundary 
-            if row - i >= 0:
-                # check end of word
-                if grid[row - i][col] == ' ':
-                    break
-                # build up beginning of word
-                word = grid[row - i][col] + word
+        # the crossing letter is part of an existing word, so only check neighbors of the others
+        if i == letter_idx:
+            continue
+        
+        # check for adjacent words in the col to left
+        if has_left and grid[idx - 1] != BLANK:
+            if is_adjacent_word(grid, size, start + i, col - 1, 'H', words_by_first, max_len, adj_cache):
+                num_overlaps += 1
             else:
-                break
-
-        # look down
-        for i in range(1, max_len):            
-            # check boundary 
-            if row + i < len(grid):
-                # check end of word
-                if grid[row + i][col] == ' ' or row + i == len(grid):
-                    break
-                # build up end of word
-                word = word + grid[row + i][col]
+                return False
+        
+        # check for adjacent words in the col to right
+        if has_right and grid[idx + 1] != BLANK:
+            if is_adjacent_word(grid, size, start + i, col + 1, 'H', words_by_first, max_len, adj_cache):
+                num_overlaps += 1
             else:
-                break
+                return False
 
-        # word is built up, so check it out
-        if word in wordlist_sorted:
-            # print("found an adjacent word")
-            return True
-        else:
-            # print(f"found a NON-word: {word}")
-            return False
+    # if all these tests pass, it's valid
+    return True, num_overlaps
 
-    # check horizontal case
-    if direction == 'H':
 
-        # build up a candidate word starting at the detected letter
-        word = grid[row][col]
+def is_adjacent_word(grid, size, row, col, direction, words_by_first, max_len, adj_cache):
+    """
+    Helper function for is_valid_placement_h/_v, called when letter detected at given row, col.
+    Check if letters detected there extend to form a valid word in given direction, looked up among words_by_first
+    for the run's first letter. Runs longer than max_len or starting with a letter no word starts with can't be
+    words, so they are rejected without building them.
+    Results are memoized in adj_cache by (row, col, direction), which is only valid while the grid is unchanged.
+    """
 
-        # look up
-        for i in range(1, max_len):            
-            # check boundary 
-            if col - i >= 0:
-                # check end of word
-                if grid[row][col - i] == ' ':
-                    break
-                # build up beginning of word
-                word = grid[row][col - i] + word
-            else:
-                break
+    # reuse the result if this cell was already checked on the current grid
+    key = (row, col, direction)
+    hit = adj_cache.get(key)
+    if hit is not None:
+        return hit
 
-        # look down
-        for i in range(1, max_len):            
-            # check boundary 
-            if col + i < len(grid):
-                # check end of word
-                if grid[row][col + i] == ' ' or col + i == len(grid):
-                    break
-                # build up end of word
-                word = word + grid[row][col + i]
-            else:
-                break
+    # check vertical case
+    if direction == 'V':
 
-        # word is built up, so check it out
-        if word in wordlist_sorted:
-            # print("found an adjacent word")
-            return True
-        else:
-            # print(f"found a NON-word: {word}")
-            return False
+        # look up and down for the first and last rows of the run of letters
+        lo = row
+        while lo > 0 and grid[(lo - 1) * size + col] != BLANK:
+            lo -= 1
+        hi = row
+        while hi < size - 1 and grid[(hi + 1) * size + col] != BLANK:
+            hi += 1
+
+        # take the run as a single strided slice of the column
+        start = lo * size + col
+        words = words_by_first.get(grid[start])
+        found = words is not None and hi - lo < max_len and bytes(grid[start:hi * size + col + 1:size]) in words
+
+    # check horizontal case
+    elif direction == 'H':
+
+        # look left and right for the first and last cols of the run of letters
+        lo = col
+        while lo > 0 and grid[row * size + lo - 1] != BLANK:
+            lo -= 1
+        hi = col
+        while hi < size - 1 and grid[row * size + hi + 1] != BLANK:
+            hi += 1
+
+        # take the run as a single slice of the row
+        start = row * size + lo
+        words = words_by_first.get(grid[start])
+        found = words is not None and hi - lo < max_len and bytes(grid[start:row * size + hi + 1]) in words
+
+    # remember the result for this grid
+    adj_cache[key] = found
+    return found
         
 
-def print_grid(grid):
+def print_grid(grid, size):
     """
     Printing helper function to display grid in terminal.
     """
-    for row in grid:
-        print(' | '.join(row))
+    for row in range(size):
+        print(' | '.join(grid[row * size:(row + 1) * size].decode('ascii')))
 
 
 def count_blanks(grid):
     """
     Helper function to count blanks in grid as measure of crossword density.
     """
-    count = 0
-    for row in range(len(grid)):
-        for col in range(len(grid)):
-            if grid[row][col] == ' ':
-                count += 1
-    return count
+    return grid.count(BLANK)
+
 
+def _build_attempt(grid, grid_size, wordlist_sorted, words_by_first, max_len, seed):
+    """
+    Helper function for generate: builds one crossword on a blank grid, seeding its own random generator.
+    Blanks the written cells again afterwards, even if the build is interrupted, so the caller can reuse the grid
+    for its next attempt; only a finished crossword is copied out.
+    Output: (blanks, crossword, placements) if every word was placed, otherwise None.
+    """
+    changes = []
+    try:
+        built = build_crossword(grid, grid_size, wordlist_sorted, words_by_first, max_len, random.Random(seed),
+                                changes)
+        if built is not None:
+            return count_blanks(grid), bytearray(grid), built[1]
+        return None
+    finally:
+        unplace_word(grid, grid_size, changes, 0)
+
+
+def _try_build(args):
+    """
+    Pool worker for generate: runs one attempt (see _build_attempt) on a grid of its own.
+    Input: tuple of (wordlist_sorted, words_by_first, max_len, grid_size, seed).
+    """
+    wordlist_sorted, words_by_first, max_len, grid_size, seed = args
+    return _build_attempt(init_grid(grid_size), grid_size, wordlist_sorted, words_by_first, max_len, seed)
 
-def generate(wordlist, verbose=False):
+
+def generate(wordlist, verbose=False, pool=None):
     """
     Generating function, callable externally.
-    Input: wordlist as list of strings.
-    Output: crossword as grid, placements dictionary.
+    Input: wordlist as list of ASCII strings, since the grid stores one byte per cell. Optionally a
+    multiprocessing.Pool owned by the caller, to run build attempts across processes and reuse between calls;
+    attempts run in batches of 5, so at most 5 of its workers are busy at once. Attempts run serially without one.
+    Output: crossword as flat grid (see init_grid), placements list (see build_crossword).
+    Raises ValueError if a word is empty or not ASCII.
     """
 
     # time the generation
     start = time.time()
 
-    # sort the wordlist
-    wordlist_sorted = sorted(wordlist, key=len, reverse=True)
+    # validate input; adjacency checks bucket words by their first letter, so every word needs one
+    for word in wordlist:
+        if not word:
+            raise ValueError("Words must be non-empty.")
+        if not word.isascii():
+            raise ValueError(f"Words must be ASCII, got {word!r}.")
+
+    # sort the wordlist, encoded once up front so all grid checks compare bytes with bytes,
+    # and save the words grouped by first letter {letter byte : frozenset of words} and max length for adjacency checks
+    wordlist_sorted = tuple(sorted((word.encode('ascii') for word in wordlist), key=len, reverse=True))
+    words_by_first = defaultdict(set)
+    for word in wordlist_sorted:
+        words_by_first[word[0]].add(word)
+    words_by_first = {letter: frozenset(words) for letter, words in words_by_first.items()}
+    max_len = len(wordlist_sorted[0])
 
     # initialize a grid size of minimum size, which is len of max len word
     grid_size = len(wordlist_sorted[0])
 
-    # logic to ensure we always get all the words with the minimum size grid
+    # logic to ensure we always get all the words with the minimum size grid;
+    # each attempt gets its own seed, drawn here so results still follow the global random state
     max_iter = 100
-    candidate_grids = {}
-    for i in range(max_iter):
-        grid = init_grid(grid_size)
-        crossword, placements = build_crossword(grid, wordlist_sorted)
-
-        # if this is a valid crossword, store it in consideration
-        if len(placements.keys()) == len(wordlist_sorted):
-            candidate_grids[count_blanks(crossword)] = (crossword, placements)
+    seeds = [random.getrandbits(32) for _ in range(max_iter)]
+    best_blanks = float('inf')
+    best = None
+
+    # try 5 times at a grid size before upping it (empirically relevant)
+    batch = 5
+
+    # attempts are independent, so run them on the caller's pool if given;
+    # serial attempts share one scratch grid per size, local to this call
+    grid = None
+    for i in range(0, max_iter, batch):
+        if pool:
+            args = [(wordlist_sorted, words_by_first, max_len, grid_size, seed) for seed in seeds[i:i + batch]]
+            results = pool.imap(_try_build, args)
         else:
-            # try at least 5 times before upping grid size (empirically relevant)
-            if i % 5 == 0:
-                grid_size += 1
-
-    # error check and find the min size grid as the winner
-    if candidate_grids:
-        crossword, placements = candidate_grids[sorted(candidate_grids.keys())[0]]
-    else:
+            if grid is None or len(grid) != grid_size * grid_size:
+                grid = init_grid(grid_size)
+            results = (_build_attempt(grid, grid_size, wordlist_sorted, words_by_first, max_len, seed)
+                       for seed in seeds[i:i + batch])
+        found = False
+        for result in results:
+
+            # if this is a valid crossword denser than the best so far, keep it instead
+            if result:
+                blanks, crossword, placements = result
+                if blanks < best_blanks:
+                    best_blanks, best = blanks, (crossword, placements, grid_size)
+                found = True
+        if not found:
+            grid_size += 1
+
+    # if random restarts never placed every word, fall back to backtracking search before giving up,
+    # from the minimum grid size upward so the first size that succeeds is the smallest the search can fill
+    if best is None:
+        for size in range(len(wordlist_sorted[0]), grid_size + 1):
+            result = search_crossword(init_grid(size), size, wordlist_sorted, words_by_first, max_len)
+            if result:
+                crossword, placements = result
+                best = (crossword, placements, size)
+                break
+
+    # error check, the densest grid is the winner
+    if best is None:
         print("A valid crossword is not possible for given wordlist.")
         return 
+    crossword, placements, size = best
         
     # display if we want to inpsect
     if verbose:
-        print_grid(crossword)
+        print_grid(crossword, size)
         print(placements)
         print(f"Total generation time: {time.time() - start} seconds.")
 
@@ -443,6 +669,7 @@ DEFAULT_WORDS = [
 
 
 # example call
-generate(DEFAULT_WORDS, verbose=True)
-generate(["cat", "tiger", "bat", "whale"], verbose=True)
+if __name__ == '__main__':
+    generate(DEFAULT_WORDS, verbose=True)
+    generate(["cat", "tiger", "bat", "whale"], verbose=True)
 